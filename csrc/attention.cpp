@@ -12,7 +12,9 @@ void paged_attention_v1(
   torch::Tensor& context_lens,
   int block_size,
   int max_context_len,
-  const c10::optional<torch::Tensor>& alibi_slopes);
+  const c10::optional<torch::Tensor>& alibi_slopes,
+  const c10::optional<torch::Tensor>& k_scales,
+  const c10::optional<torch::Tensor>& v_scales);
 
 void paged_attention_v2(
   torch::Tensor& out,
@@ -28,7 +30,9 @@ void paged_attention_v2(
   torch::Tensor& context_lens,
   int block_size,
   int max_context_len,
-  const c10::optional<torch::Tensor>& alibi_slopes);
+  const c10::optional<torch::Tensor>& alibi_slopes,
+  const c10::optional<torch::Tensor>& k_scales,
+  const c10::optional<torch::Tensor>& v_scales);
 
 PYBIND11_MODULE(TORCH_EXTENSION_NAME, m) {
   m.def(
@@ -0,0 +1,29 @@
+#pragma once
+
+#include "attention_generic.cuh"
+
+#include <stdint.h>
+
+namespace vllm {
+
+// Define int8 vector types for the quantized KV cache. The vectors are
+// only used as raw 16-byte-aligned loads; the elements are unpacked and
+// dequantized into the query dtype before any arithmetic.
+template<>
+struct Vec<int8_t, 1> {
+  using Type = int8_t;
+};
+template<>
+struct Vec<int8_t, 2> {
+  using Type = int16_t;
+};
+template<>
+struct Vec<int8_t, 4> {
+  using Type = int32_t;
+};
+template<>
+struct Vec<int8_t, 8> {
+  using Type = int64_t;
+};
+
+} // namespace vllm
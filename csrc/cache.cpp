@@ -20,6 +20,15 @@ void reshape_and_cache(
   torch::Tensor& value_cache,
   torch::Tensor& slot_mapping);
 
+void reshape_and_cache_quantized(
+  torch::Tensor& key,
+  torch::Tensor& value,
+  torch::Tensor& key_cache,
+  torch::Tensor& value_cache,
+  torch::Tensor& slot_mapping,
+  torch::Tensor& k_scales,
+  torch::Tensor& v_scales);
+
 void gather_cached_kv(
   torch::Tensor& key,
   torch::Tensor& value,
@@ -40,6 +49,10 @@ PYBIND11_MODULE(TORCH_EXTENSION_NAME, m) {
     "reshape_and_cache",
     &reshape_and_cache,
     "Reshape the key and value tensors and cache them");
+  m.def(
+    "reshape_and_cache_quantized",
+    &reshape_and_cache_quantized,
+    "Quantize the key and value tensors to int8 and cache them");
   m.def(
     "gather_cached_kv",
     &gather_cached_kv,
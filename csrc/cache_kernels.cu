@@ -127,7 +127,7 @@ void copy_blocks(
   dim3 grid(num_layers, num_pairs);
   dim3 block(std::min(1024, numel_per_block));
   const cudaStream_t stream = at::cuda::getCurrentCUDAStream();
-  VLLM_DISPATCH_FLOATING_TYPES(
+  VLLM_DISPATCH_FLOATING_AND_BYTE_TYPES(
     key_caches[0].scalar_type(), "copy_blocks_kernel", ([&] {
       vllm::copy_blocks_kernel<scalar_t><<<grid, block, 0, stream>>>(
         key_cache_ptrs_tensor.data_ptr<int64_t>(),
@@ -186,6 +186,67 @@ __global__ void reshape_and_cache_kernel(
   }
 }
 
+// Quantizes a single cache entry to int8 with round-to-nearest.
+inline __device__ int8_t quantize_to_int8(const float val,
+                                          const float inv_scale) {
+  int32_t quantized = __float2int_rn(val * inv_scale);
+  quantized = min(max(quantized, -128), 127);
+  return static_cast<int8_t>(quantized);
+}
+
+template<typename scalar_t>
+__global__ void reshape_and_cache_quantized_kernel(
+  const scalar_t* __restrict__ key,           // [num_tokens, num_heads, head_size]
+  const scalar_t* __restrict__ value,         // [num_tokens, num_heads, head_size]
+  int8_t* __restrict__ key_cache,             // [num_blocks, num_heads, head_size/x, block_size, x]
+  int8_t* __restrict__ value_cache,           // [num_blocks, num_heads, head_size, block_size]
+  const int64_t* __restrict__ slot_mapping,   // [num_tokens]
+  const float* __restrict__ k_scales,         // [num_heads]
+  const float* __restrict__ v_scales,         // [num_heads]
+  const int key_stride,
+  const int value_stride,
+  const int num_heads,
+  const int head_size,
+  const int block_size,
+  const int x) {
+  const int64_t token_idx = blockIdx.x;
+  const int64_t slot_idx = slot_mapping[token_idx];
+  if (slot_idx < 0) {
+    // Padding token that should be ignored.
+    return;
+  }
+
+  const int64_t block_idx = slot_idx / block_size;
+  const int64_t block_offset = slot_idx % block_size;
+
+  const int n = num_heads * head_size;
+  for (int i = threadIdx.x; i < n; i += blockDim.x) {
+    const int64_t src_key_idx = token_idx * key_stride + i;
+    const int64_t src_value_idx = token_idx * value_stride + i;
+
+    const int head_idx = i / head_size;
+    const int head_offset = i % head_size;
+    const int x_idx = head_offset / x;
+    const int x_offset = head_offset % x;
+
+    const int64_t tgt_key_idx = block_idx * num_heads * (head_size / x) * block_size * x
+                                + head_idx * (head_size / x) * block_size * x
+                                + x_idx * block_size * x
+                                + block_offset * x
+                                + x_offset;
+    const int64_t tgt_value_idx = block_idx * num_heads * head_size * block_size
+                                  + head_idx * head_size * block_size
+                                  + head_offset * block_size
+                                  + block_offset;
+    const float inv_k_scale = __fdividef(1.f, k_scales[head_idx]);
+    const float inv_v_scale = __fdividef(1.f, v_scales[head_idx]);
+    key_cache[tgt_key_idx] = quantize_to_int8(
+      static_cast<float>(key[src_key_idx]), inv_k_scale);
+    value_cache[tgt_value_idx] = quantize_to_int8(
+      static_cast<float>(value[src_value_idx]), inv_v_scale);
+  }
+}
+
 } // namespace vllm
 
 void reshape_and_cache(
@@ -226,6 +287,53 @@ void reshape_and_cache(
     });
 }
 
+void reshape_and_cache_quantized(
+  torch::Tensor& key,           // [num_tokens, num_heads, head_size]
+  torch::Tensor& value,         // [num_tokens, num_heads, head_size]
+  torch::Tensor& key_cache,     // [num_blocks, num_heads, head_size/x, block_size, x]
+  torch::Tensor& value_cache,   // [num_blocks, num_heads, head_size, block_size]
+  torch::Tensor& slot_mapping,  // [num_tokens]
+  torch::Tensor& k_scales,      // [num_heads]
+  torch::Tensor& v_scales)      // [num_heads]
+{
+  TORCH_CHECK(key_cache.scalar_type() == at::ScalarType::Char,
+              "key_cache must be int8");
+  TORCH_CHECK(value_cache.scalar_type() == at::ScalarType::Char,
+              "value_cache must be int8");
+
+  int num_tokens = key.size(0);
+  int num_heads = key.size(1);
+  int head_size = key.size(2);
+  int block_size = key_cache.size(3);
+  int x = key_cache.size(4);
+
+  int key_stride = key.stride(0);
+  int value_stride = value.stride(0);
+
+  dim3 grid(num_tokens);
+  dim3 block(std::min(num_heads * head_size, 512));
+  const cudaStream_t stream = at::cuda::getCurrentCUDAStream();
+  VLLM_DISPATCH_FLOATING_TYPES(
+    key.scalar_type(),
+    "reshape_and_cache_quantized_kernel",
+    [&] {
+      vllm::reshape_and_cache_quantized_kernel<scalar_t><<<grid, block, 0, stream>>>(
+        key.data_ptr<scalar_t>(),
+        value.data_ptr<scalar_t>(),
+        key_cache.data_ptr<int8_t>(),
+        value_cache.data_ptr<int8_t>(),
+        slot_mapping.data_ptr<int64_t>(),
+        k_scales.data_ptr<float>(),
+        v_scales.data_ptr<float>(),
+        key_stride,
+        value_stride,
+        num_heads,
+        head_size,
+        block_size,
+        x);
+    });
+}
+
 namespace vllm {
 
 // Grid: (num_blocks, block_size).
@@ -12,3 +12,13 @@
 #define VLLM_DISPATCH_FLOATING_TYPES(TYPE, NAME, ...)             \
   AT_DISPATCH_SWITCH(                                             \
     TYPE, NAME, VLLM_DISPATCH_CASE_FLOATING_TYPES(__VA_ARGS__))
+
+// Like the above, but also covers the int8 KV cache.
+#define VLLM_DISPATCH_CASE_FLOATING_AND_BYTE_TYPES(...)           \
+  VLLM_DISPATCH_CASE_FLOATING_TYPES(__VA_ARGS__)                  \
+  AT_DISPATCH_CASE(at::ScalarType::Char, __VA_ARGS__)
+
+#define VLLM_DISPATCH_FLOATING_AND_BYTE_TYPES(TYPE, NAME, ...)    \
+  AT_DISPATCH_SWITCH(                                             \
+    TYPE, NAME,                                                   \
+    VLLM_DISPATCH_CASE_FLOATING_AND_BYTE_TYPES(__VA_ARGS__))
@@ -23,9 +23,51 @@ NUM_HEADS = [(40, 40), (64, 8)]  # Arbitrary values for testing
 HEAD_SIZES = [64, 80, 96, 112, 128, 256]
 BLOCK_SIZES = [16, 32]
 USE_ALIBI = [False, True]
+KV_CACHE_DTYPES = ["auto", "int8"]
 SEEDS = [0]
 
 
+def quantize_kv_cache(
+    key_cache: torch.Tensor,
+    value_cache: torch.Tensor,
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor,
+           torch.Tensor, torch.Tensor]:
+    """Quantizes KV caches to int8 with per-head scales.
+
+    Returns the int8 caches (the int8 key cache is packed with x = 16), the
+    scales, and the dequantized caches in the original layout so that the
+    reference implementation reads the same (lossy) cache contents as the
+    kernel.
+    """
+    dtype = key_cache.dtype
+    num_blocks, num_heads, _, block_size, x = key_cache.shape
+    head_size = value_cache.shape[2]
+
+    # Unpack the key cache to [num_blocks, num_heads, head_size, block_size].
+    key = key_cache.permute(0, 1, 2, 4, 3).reshape(num_blocks, num_heads,
+                                                   head_size, block_size)
+    k_scales = key.abs().amax(dim=(0, 2, 3)).float() / 127.0
+    v_scales = value_cache.abs().amax(dim=(0, 2, 3)).float() / 127.0
+    key_int8 = torch.round(key.float() / k_scales.view(1, -1, 1, 1)).clamp_(
+        -128, 127).to(torch.int8)
+    value_cache_int8 = torch.round(
+        value_cache.float() / v_scales.view(1, -1, 1, 1)).clamp_(
+            -128, 127).to(torch.int8)
+
+    # Repack the int8 key cache with x = 16 (16 bytes of int8).
+    key_cache_int8 = key_int8.reshape(num_blocks, num_heads, head_size // 16,
+                                      16, block_size).permute(
+                                          0, 1, 2, 4, 3).contiguous()
+    key_ref = (key_int8.float() * k_scales.view(1, -1, 1, 1)).to(dtype)
+    key_cache_ref = key_ref.reshape(num_blocks, num_heads, head_size // x, x,
+                                    block_size).permute(0, 1, 2, 4,
+                                                        3).contiguous()
+    value_cache_ref = (value_cache_int8.float() *
+                       v_scales.view(1, -1, 1, 1)).to(dtype)
+    return (key_cache_int8, value_cache_int8, k_scales, v_scales,
+            key_cache_ref, value_cache_ref)
+
+
 def ref_masked_attention(
     query: torch.Tensor,
     key: torch.Tensor,
@@ -104,6 +146,7 @@ def ref_single_query_cached_kv_attention(
 @pytest.mark.parametrize("use_alibi", USE_ALIBI)
 @pytest.mark.parametrize("block_size", BLOCK_SIZES)
 @pytest.mark.parametrize("dtype", DTYPES)
+@pytest.mark.parametrize("kv_cache_dtype", KV_CACHE_DTYPES)
 @pytest.mark.parametrize("seed", SEEDS)
 def test_paged_attention(
     kv_cache_factory,
@@ -114,6 +157,7 @@ def test_paged_attention(
     use_alibi: bool,
     block_size: int,
     dtype: torch.dtype,
+    kv_cache_dtype: str,
     seed: int,
 ) -> None:
     random.seed(seed)
@@ -162,14 +206,24 @@ def test_paged_attention(
                                                 seed)
     key_cache, value_cache = key_caches[0], value_caches[0]
 
+    k_scales = None
+    v_scales = None
+    kernel_key_cache = key_cache
+    kernel_value_cache = value_cache
+    if kv_cache_dtype == "int8":
+        # The kernel reads the int8 caches while the reference reads the
+        # dequantized copies, so both see the same (lossy) cache contents.
+        (kernel_key_cache, kernel_value_cache, k_scales, v_scales, key_cache,
+         value_cache) = quantize_kv_cache(key_cache, value_cache)
+
     # Call the paged attention kernel.
     output = torch.empty_like(query)
     if version == "v1":
         attention_ops.paged_attention_v1(
             output,
             query,
-            key_cache,
-            value_cache,
+            kernel_key_cache,
+            kernel_value_cache,
             head_mapping,
             scale,
             block_tables,
@@ -177,6 +231,8 @@ def test_paged_attention(
             block_size,
             max_context_len,
             alibi_slopes,
+            k_scales,
+            v_scales,
         )
     elif version == "v2":
         num_partitions = ((max_context_len + PARTITION_SIZE - 1) //
@@ -200,8 +256,8 @@ def test_paged_attention(
             max_logits,
             tmp_output,
             query,
-            key_cache,
-            value_cache,
+            kernel_key_cache,
+            kernel_value_cache,
             head_mapping,
             scale,
             block_tables,
@@ -209,6 +265,8 @@ def test_paged_attention(
             block_size,
             max_context_len,
             alibi_slopes,
+            k_scales,
+            v_scales,
         )
     else:
         assert False, f"Unknown version: {version}"
@@ -144,3 +144,91 @@ def test_reshape_and_cache(
 
     assert torch.allclose(key_cache, cloned_key_cache)
     assert torch.allclose(value_cache, cloned_value_cache)
+
+
+@pytest.mark.parametrize("num_tokens", NUM_TOKENS)
+@pytest.mark.parametrize("num_heads", NUM_HEADS)
+@pytest.mark.parametrize("head_size", HEAD_SIZES)
+@pytest.mark.parametrize("block_size", BLOCK_SIZES)
+@pytest.mark.parametrize("num_blocks", NUM_BLOCKS)
+@pytest.mark.parametrize("dtype", DTYPES)
+@pytest.mark.parametrize("seed", SEEDS)
+@torch.inference_mode()
+def test_reshape_and_cache_quantized(
+    num_tokens: int,
+    num_heads: int,
+    head_size: int,
+    block_size: int,
+    num_blocks: int,
+    dtype: torch.dtype,
+    seed: int,
+) -> None:
+    random.seed(seed)
+    torch.random.manual_seed(seed)
+    torch.cuda.manual_seed(seed)
+
+    # Create a random slot mapping.
+    num_slots = block_size * num_blocks
+    slot_mapping = random.sample(range(num_slots), num_tokens)
+    slot_mapping = torch.tensor(slot_mapping, dtype=torch.long, device="cuda")
+
+    qkv = torch.randn(num_tokens,
+                      3,
+                      num_heads,
+                      head_size,
+                      dtype=dtype,
+                      device="cuda")
+    _, key, value = qkv.unbind(dim=1)
+
+    # Create the int8 KV caches. The int8 key cache is packed with x = 16
+    # (16 bytes of int8).
+    x = 16
+    key_cache = torch.randint(-128,
+                              128,
+                              (num_blocks, num_heads, head_size // x,
+                               block_size, x),
+                              dtype=torch.int8,
+                              device="cuda")
+    value_cache = torch.randint(-128,
+                                128,
+                                (num_blocks, num_heads, head_size, block_size),
+                                dtype=torch.int8,
+                                device="cuda")
+
+    # Per-head scales.
+    k_scales = key.abs().amax(dim=(0, 2)).float() / 127.0
+    v_scales = value.abs().amax(dim=(0, 2)).float() / 127.0
+
+    # Clone the KV caches.
+    cloned_key_cache = key_cache.clone()
+    cloned_value_cache = value_cache.clone()
+
+    # Call the reshape_and_cache_quantized kernel.
+    cache_ops.reshape_and_cache_quantized(key, value, key_cache, value_cache,
+                                          slot_mapping, k_scales, v_scales)
+
+    # Run the reference implementation.
+    quantized_key = torch.round(key.float() / k_scales.view(1, -1, 1)).clamp_(
+        -128, 127).to(torch.int8)
+    quantized_value = torch.round(
+        value.float() / v_scales.view(1, -1, 1)).clamp_(-128,
+                                                        127).to(torch.int8)
+    reshaped_key = quantized_key.reshape(num_tokens, num_heads, head_size // x,
+                                         x)
+    block_indicies = torch.div(slot_mapping, block_size, rounding_mode="floor")
+    block_indicies = block_indicies.cpu().tolist()
+    block_offsets = slot_mapping % block_size
+    block_offsets = block_offsets.cpu().tolist()
+    for i in range(num_tokens):
+        block_idx = block_indicies[i]
+        block_offset = block_offsets[i]
+        cloned_key_cache[block_idx, :, :, block_offset, :] = reshaped_key[i]
+        cloned_value_cache[block_idx, :, :, block_offset] = quantized_value[i]
+
+    # NOTE: torch.round and the kernel's __float2int_rn can disagree by one
+    # step for values exactly on the rounding boundary, so allow an
+    # off-by-one difference.
+    assert torch.allclose(key_cache.float(), cloned_key_cache.float(), atol=1)
+    assert torch.allclose(value_cache.float(),
+                          cloned_value_cache.float(),
+                          atol=1)
@@ -56,3 +56,37 @@ def test_rms_norm(
     )
     ref_out = ref(x)
     assert torch.allclose(out, ref_out, atol=1e-2, rtol=1e-5)
+
+
+@pytest.mark.parametrize("num_tokens", NUM_TOKENS)
+@pytest.mark.parametrize("hidden_size", HIDDEN_SIZES)
+@pytest.mark.parametrize("dtype", DTYPES)
+@pytest.mark.parametrize("seed", SEEDS)
+@torch.inference_mode()
+def test_fused_add_rms_norm(
+    num_tokens: int,
+    hidden_size: int,
+    dtype: torch.dtype,
+    seed: int,
+) -> None:
+    torch.random.manual_seed(seed)
+    torch.cuda.manual_seed(seed)
+
+    scale = float(hidden_size**-0.5)
+    x = torch.empty(num_tokens, hidden_size, dtype=dtype, device="cuda")
+    x.uniform_(-scale, scale)
+    residual = torch.empty_like(x)
+    residual.uniform_(-scale, scale)
+    ref = RefRMSNorm(hidden_size).to(dtype).cuda()
+
+    ref_residual_out = x + residual
+    ref_out = ref(ref_residual_out)
+    # NOTE: The kernel updates x and residual in place.
+    layernorm_ops.fused_add_rms_norm(
+        x,
+        residual,
+        ref.weight.data,
+        ref.variance_epsilon,
+    )
+    assert torch.allclose(residual, ref_residual_out, atol=1e-2, rtol=1e-5)
+    assert torch.allclose(x, ref_out, atol=1e-2, rtol=1e-5)
@@ -48,6 +48,9 @@ class ModelConfig:
             output). If None, will be derived from the model.
         quantization: Quantization method that was used to quantize the model
             weights. If None, we assume the model weights are not quantized.
+        kv_cache_dtype: Data type of the KV cache. The "auto" option uses the
+            model dtype; "int8" stores the cache in int8 with per-head scales,
+            halving its size at the cost of quantization error.
     """
 
     def __init__(
@@ -64,6 +67,7 @@ class ModelConfig:
         tokenizer_revision: Optional[str] = None,
         max_model_len: Optional[int] = None,
         quantization: Optional[str] = None,
+        kv_cache_dtype: str = "auto",
     ) -> None:
         self.model = model
         self.tokenizer = tokenizer
@@ -75,6 +79,7 @@ class ModelConfig:
         self.revision = revision
         self.tokenizer_revision = tokenizer_revision
         self.quantization = quantization
+        self.kv_cache_dtype = kv_cache_dtype
 
         self.hf_config = get_config(model, trust_remote_code, revision)
         self.dtype = _get_and_verify_dtype(self.hf_config, dtype)
@@ -83,6 +88,7 @@ class ModelConfig:
         self._verify_load_format()
         self._verify_tokenizer_mode()
         self._verify_quantization()
+        self._verify_kv_cache_dtype()
 
     def _verify_load_format(self) -> None:
         load_format = self.load_format.lower()
@@ -103,7 +109,7 @@ class ModelConfig:
         self.tokenizer_mode = tokenizer_mode
 
     def _verify_quantization(self) -> None:
-        supported_quantization = ["awq", "squeezellm"]
+        supported_quantization = ["awq", "fp8", "smoothquant", "squeezellm"]
         if self.quantization is None:
             return
         quantization = self.quantization.lower()
@@ -113,6 +119,15 @@ class ModelConfig:
                 f"{supported_quantization}.")
         self.quantization = quantization
 
+    def _verify_kv_cache_dtype(self) -> None:
+        supported_kv_cache_dtypes = ["auto", "int8"]
+        kv_cache_dtype = self.kv_cache_dtype.lower()
+        if kv_cache_dtype not in supported_kv_cache_dtypes:
+            raise ValueError(
+                f"Unknown KV cache dtype: {self.kv_cache_dtype}. Must be one "
+                f"of {supported_kv_cache_dtypes}.")
+        self.kv_cache_dtype = kv_cache_dtype
+
     def verify_with_parallel_config(
         self,
         parallel_config: "ParallelConfig",
@@ -23,6 +23,7 @@ class EngineArgs:
     pipeline_parallel_size: int = 1
     tensor_parallel_size: int = 1
     block_size: int = 16
+    kv_cache_dtype: str = 'auto'
     swap_space: int = 4  # GiB
     gpu_memory_utilization: float = 0.90
     max_num_batched_tokens: Optional[int] = None
@@ -134,6 +135,13 @@ class EngineArgs:
                             default=EngineArgs.block_size,
                             choices=[8, 16, 32],
                             help='token block size')
+        parser.add_argument('--kv-cache-dtype',
+                            type=str,
+                            default=EngineArgs.kv_cache_dtype,
+                            choices=['auto', 'int8'],
+                            help='data type of the KV cache. "auto" uses the '
+                            'model dtype; "int8" stores the cache in int8 '
+                            'with per-head scales, halving its size')
         # TODO(woosuk): Support fine-grained seeds (e.g., seed per request).
         parser.add_argument('--seed',
                             type=int,
@@ -189,7 +197,7 @@ class EngineArgs:
                                    self.download_dir, self.load_format,
                                    self.dtype, self.seed, self.revision,
                                    self.tokenizer_revision, self.max_model_len,
-                                   self.quantization)
+                                   self.quantization, self.kv_cache_dtype)
         cache_config = CacheConfig(
             self.block_size, self.gpu_memory_utilization, self.swap_space,
             getattr(model_config.hf_config, 'sliding_window', None))
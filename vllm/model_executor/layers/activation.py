@@ -1,4 +1,6 @@
 """Custom activation functions."""
+from typing import Optional
+
 import torch
 import torch.nn as nn
 
@@ -12,13 +14,19 @@ class SiluAndMul(nn.Module):
 
     Shapes:
         x: (batch_size, seq_len, 2 * d) or (num_tokens, 2 * d)
+        out: optional preallocated output tensor of the return shape.
         return: (batch_size, seq_len, d) or (num_tokens, d)
     """
 
-    def forward(self, x: torch.Tensor) -> torch.Tensor:
+    def forward(
+        self,
+        x: torch.Tensor,
+        out: Optional[torch.Tensor] = None,
+    ) -> torch.Tensor:
         d = x.shape[-1] // 2
         output_shape = (x.shape[:-1] + (d, ))
-        out = torch.empty(output_shape, dtype=x.dtype, device=x.device)
+        if out is None:
+            out = torch.empty(output_shape, dtype=x.dtype, device=x.device)
         activation_ops.silu_and_mul(out, x)
         return out
 
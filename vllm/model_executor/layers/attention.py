@@ -1,5 +1,5 @@
 """Multi-head attention."""
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import torch
 import torch.nn as nn
@@ -15,8 +15,13 @@ from vllm.model_executor.layers.rotary_embedding import (
     RotaryEmbedding)
 
 _SUPPORTED_HEAD_SIZES = [64, 80, 96, 112, 128, 256]
+_SUPPORTED_KV_CACHE_DTYPES = ["auto", "int8"]
 # Should be the same as PARTITION_SIZE in `paged_attention_v2_launcher`.
 _PARTITION_SIZE = 512
+# Default per-head scale for the int8 KV cache when no calibrated scales
+# are given: the representable range then covers key/value magnitudes up
+# to ~8, which is ample for common LLMs. Values outside it are clamped.
+_DEFAULT_KV_CACHE_SCALE = 8.0 / 127.0
 
 
 class PagedAttention(nn.Module):
@@ -38,6 +43,11 @@ class PagedAttention(nn.Module):
         This operation reads the previous key and value tensors from the KV
         cache.
     5. Return the output tensor.
+
+    When `kv_cache_dtype` is "int8", the keys and values are quantized with
+    per-head scales as they are written to the cache, and dequantized on the
+    fly inside the paged attention kernels. This halves the cache footprint
+    and the per-step cache traffic relative to an fp16 cache.
     """
 
     def __init__(self,
@@ -45,7 +55,10 @@ class PagedAttention(nn.Module):
                  head_size: int,
                  scale: float,
                  num_kv_heads: Optional[int] = None,
-                 sliding_window: Optional[int] = None) -> None:
+                 sliding_window: Optional[int] = None,
+                 kv_cache_dtype: str = "auto",
+                 k_scales: Optional[torch.Tensor] = None,
+                 v_scales: Optional[torch.Tensor] = None) -> None:
         super().__init__()
         self.num_heads = num_heads
         self.head_size = head_size
@@ -62,6 +75,31 @@ class PagedAttention(nn.Module):
         if self.head_size not in _SUPPORTED_HEAD_SIZES:
             raise ValueError(f"head_size ({self.head_size}) is not supported. "
                              f"Supported head sizes: {_SUPPORTED_HEAD_SIZES}.")
+        if kv_cache_dtype not in _SUPPORTED_KV_CACHE_DTYPES:
+            raise ValueError(
+                f"kv_cache_dtype ({kv_cache_dtype}) is not supported. "
+                f"Supported KV cache dtypes: {_SUPPORTED_KV_CACHE_DTYPES}.")
+        self.kv_cache_dtype = kv_cache_dtype
+        if kv_cache_dtype == "int8":
+            # Per-head scales used both when quantizing the keys/values into
+            # the cache and when dequantizing them in the attention kernels.
+            if k_scales is None:
+                k_scales = torch.full((self.num_kv_heads, ),
+                                      _DEFAULT_KV_CACHE_SCALE)
+            if v_scales is None:
+                v_scales = torch.full((self.num_kv_heads, ),
+                                      _DEFAULT_KV_CACHE_SCALE)
+            self.register_buffer("k_scales",
+                                 k_scales.detach().to(dtype=torch.float32,
+                                                      device="cuda"),
+                                 persistent=False)
+            self.register_buffer("v_scales",
+                                 v_scales.detach().to(dtype=torch.float32,
+                                                      device="cuda"),
+                                 persistent=False)
+        else:
+            self.k_scales = None
+            self.v_scales = None
 
     def set_attn_bias(
         self,
@@ -171,6 +209,8 @@ class PagedAttention(nn.Module):
                 block_size,
                 input_metadata.max_context_len,
                 alibi_slopes,
+                self.k_scales,
+                self.v_scales,
             )
         else:
             # Run PagedAttention V2.
@@ -201,6 +241,8 @@ class PagedAttention(nn.Module):
                 block_size,
                 input_metadata.max_context_len,
                 alibi_slopes,
+                self.k_scales,
+                self.v_scales,
             )
 
     def forward(
@@ -271,13 +313,24 @@ class PagedAttention(nn.Module):
                 value_to_cache = value_to_cache[input_metadata.to_cache]
                 slot_mapping = slot_mapping[input_metadata.to_cache]
 
-            cache_ops.reshape_and_cache(
-                key_to_cache,
-                value_to_cache,
-                key_cache,
-                value_cache,
-                slot_mapping,
-            )
+            if self.kv_cache_dtype == "int8":
+                cache_ops.reshape_and_cache_quantized(
+                    key_to_cache,
+                    value_to_cache,
+                    key_cache,
+                    value_cache,
+                    slot_mapping,
+                    self.k_scales,
+                    self.v_scales,
+                )
+            else:
+                cache_ops.reshape_and_cache(
+                    key_to_cache,
+                    value_to_cache,
+                    key_cache,
+                    value_cache,
+                    slot_mapping,
+                )
 
         if input_metadata.num_generation_tokens > 0:
             # Decoding run.
@@ -311,12 +364,18 @@ class PagedAttentionWithRoPE(PagedAttention):
         is_neox_style: bool = True,
         rope_scaling: Optional[Dict[str, Any]] = None,
         sliding_window: Optional[int] = None,
+        kv_cache_dtype: str = "auto",
+        k_scales: Optional[torch.Tensor] = None,
+        v_scales: Optional[torch.Tensor] = None,
     ) -> None:
         super().__init__(num_heads,
                          head_size,
                          scale,
                          num_kv_heads,
-                         sliding_window=sliding_window)
+                         sliding_window=sliding_window,
+                         kv_cache_dtype=kv_cache_dtype,
+                         k_scales=k_scales,
+                         v_scales=v_scales)
         if rope_scaling is None:
             self.rotary_emb = RotaryEmbedding(head_size, rotary_dim,
                                               max_position, base,
@@ -377,6 +436,53 @@ class PagedAttentionWithRoPE(PagedAttention):
             cache_event,
         )
 
+    def forward_packed_qkv(
+        self,
+        positions: torch.Tensor,
+        qkv: torch.Tensor,
+        key_cache: torch.Tensor,
+        value_cache: torch.Tensor,
+        input_metadata: InputMetadata,
+        cache_event: Optional[torch.cuda.Event],
+    ) -> torch.Tensor:
+        """PagedAttention forward pass with a packed [Q|K|V] tensor.
+
+        This is a zero-copy variant of `forward` for models that compute
+        query, key, and value with a single fused linear layer. The query,
+        key, and value views are sliced from the packed tensor without
+        materializing copies, and the rotary embedding kernel rotates the
+        query and key in place inside the packed tensor in a single launch.
+
+        Args:
+            positions: shape = [batch_size, seq_len]
+            qkv: shape = [batch_size, seq_len,
+                (num_heads + 2 * num_kv_heads) * head_size]
+            key_cache: shape = [num_blocks, num_kv_heads, head_size/x,
+                block_size, x]
+            value_cache: shape = [num_blocks, num_kv_heads, head_size,
+                block_size]
+            input_metadata: metadata for paged attention.
+            cache_event: event to wait for the cache operations to finish.
+
+        Returns:
+            shape = [batch_size, seq_len, num_heads * head_size]
+        """
+        q_size = self.num_heads * self.head_size
+        kv_size = self.num_kv_heads * self.head_size
+        # NOTE: The splits are views into `qkv`. The attention kernels are
+        # stride-aware, so no contiguity copy is made.
+        query, key, value = qkv.split([q_size, kv_size, kv_size], dim=-1)
+        return self.forward(
+            positions,
+            query,
+            key,
+            value,
+            key_cache,
+            value_cache,
+            input_metadata,
+            cache_event,
+        )
+
 
 class PagedAttentionWithALiBi(PagedAttention):
     """PagedAttention with ALiBi attention bias."""
@@ -385,12 +491,27 @@ class PagedAttentionWithALiBi(PagedAttention):
                  num_heads: int,
                  head_size: int,
                  scale: float,
-                 slopes: List[float],
-                 num_kv_heads: Optional[int] = None) -> None:
-        super().__init__(num_heads, head_size, scale, num_kv_heads)
+                 slopes: Union[List[float], torch.Tensor],
+                 num_kv_heads: Optional[int] = None,
+                 kv_cache_dtype: str = "auto",
+                 k_scales: Optional[torch.Tensor] = None,
+                 v_scales: Optional[torch.Tensor] = None) -> None:
+        super().__init__(num_heads,
+                         head_size,
+                         scale,
+                         num_kv_heads,
+                         kv_cache_dtype=kv_cache_dtype,
+                         k_scales=k_scales,
+                         v_scales=v_scales)
         assert len(slopes) == num_heads
 
-        slopes = torch.tensor(slopes, dtype=torch.float32)
+        # Keep the slopes as a persistent GPU tensor so kernel launches
+        # reference them directly instead of re-marshalling a Python list
+        # on every call.
+        if isinstance(slopes, torch.Tensor):
+            slopes = slopes.detach().to(dtype=torch.float32, device="cuda")
+        else:
+            slopes = torch.tensor(slopes, dtype=torch.float32, device="cuda")
         self.register_buffer("alibi_slopes", slopes, persistent=False)
 
     def set_attn_bias(self, input_metadata: InputMetadata,
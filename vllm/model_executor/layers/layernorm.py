@@ -1,15 +1,41 @@
 """Custom normalization layers."""
+import functools
+from typing import Optional, Tuple, Union
+
 import torch
 import torch.nn as nn
 
 from vllm import layernorm_ops
 
+try:
+    from flashinfer.norm import fused_add_rmsnorm as _flashinfer_fused_add
+    from flashinfer.norm import rmsnorm as _flashinfer_rmsnorm
+except ImportError:
+    _flashinfer_fused_add = None
+    _flashinfer_rmsnorm = None
+
+
+@functools.lru_cache(maxsize=None)
+def _use_flashinfer_norm() -> bool:
+    # FlashInfer's normalization kernels are tuned for Ampere and newer.
+    # On older GPUs (or when flashinfer is not installed) fall back to the
+    # in-tree kernels. Both implementations share the same eps semantics.
+    if _flashinfer_rmsnorm is None:
+        return False
+    return torch.cuda.get_device_capability() >= (8, 0)
+
 
 class RMSNorm(nn.Module):
     """Root mean square normalization.
 
     Computes x -> w * x / sqrt(E[x^2] + eps) where w is the learned weight.
     Refer to https://arxiv.org/abs/1910.07467
+
+    If `residual` is provided, the residual connection is fused into the
+    normalization kernel: the kernel first computes x + residual, then
+    normalizes the sum. Both the normalized output and the updated residual
+    (i.e., x + residual) are returned. This saves one full read and write of
+    the hidden states compared to adding the residual separately.
     """
 
     def __init__(
@@ -21,7 +47,27 @@ class RMSNorm(nn.Module):
         self.weight = nn.Parameter(torch.ones(hidden_size))
         self.variance_epsilon = eps
 
-    def forward(self, x: torch.Tensor) -> torch.Tensor:
+    def forward(
+        self,
+        x: torch.Tensor,
+        residual: Optional[torch.Tensor] = None,
+    ) -> Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]:
+        if residual is not None:
+            # NOTE: Both kernels update `x` and `residual` in place.
+            if _use_flashinfer_norm():
+                _flashinfer_fused_add(x, residual, self.weight.data,
+                                      self.variance_epsilon)
+            else:
+                layernorm_ops.fused_add_rms_norm(
+                    x,
+                    residual,
+                    self.weight.data,
+                    self.variance_epsilon,
+                )
+            return x, residual
+        if _use_flashinfer_norm():
+            return _flashinfer_rmsnorm(x, self.weight.data,
+                                       self.variance_epsilon)
         out = torch.empty_like(x)
         layernorm_ops.rms_norm(
             out,
@@ -1,5 +1,9 @@
 from vllm.model_executor.layers.quantized_linear.awq import (
     AWQColumnParallelLinear, AWQRowParallelLinear)
+from vllm.model_executor.layers.quantized_linear.fp8 import (
+    FP8ColumnParallelLinear, FP8RowParallelLinear)
+from vllm.model_executor.layers.quantized_linear.smoothquant import (
+    SmoothQuantColumnParallelLinear, SmoothQuantRowParallelLinear)
 from vllm.model_executor.layers.quantized_linear.squeezellm import (
     SqueezeLLMColumnParallelLinear, SqueezeLLMRowParallelLinear)
 from vllm.model_executor.parallel_utils.layers import (ColumnParallelLinear,
@@ -7,6 +11,9 @@ from vllm.model_executor.parallel_utils.layers import (ColumnParallelLinear,
 
 _QUANTIZED_LINEAR_REGISTRY = {
     "awq": (AWQColumnParallelLinear, AWQRowParallelLinear),
+    "fp8": (FP8ColumnParallelLinear, FP8RowParallelLinear),
+    "smoothquant":
+    (SmoothQuantColumnParallelLinear, SmoothQuantRowParallelLinear),
     "squeezellm":
     (SqueezeLLMColumnParallelLinear, SqueezeLLMRowParallelLinear),
 }
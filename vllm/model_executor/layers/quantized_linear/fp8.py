@@ -0,0 +1,98 @@
+from typing import Optional, Tuple
+
+import torch
+import torch.nn.functional as F
+from torch.nn.parameter import Parameter
+
+from vllm.model_executor.parallel_utils.layers import (ColumnParallelLinear,
+                                                       RowParallelLinear)
+
+
+def fp8_quantize(weight: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Quantizes a weight to FP8 (E4M3) with per-output-channel scales.
+
+    Args:
+        weight: shape = [output_size, input_size]
+
+    Returns:
+        qweight: float8_e4m3fn tensor of the same shape as `weight`.
+        scale: tensor of shape [output_size] in the dtype of `weight`.
+    """
+    finfo = torch.finfo(torch.float8_e4m3fn)
+    scale = weight.abs().amax(dim=1).float().clamp_min(1e-12) / finfo.max
+    qweight = (weight.float() / scale.unsqueeze(1)).clamp_(
+        finfo.min, finfo.max).to(torch.float8_e4m3fn)
+    return qweight, scale.to(weight.dtype)
+
+
+def _dequantize(
+    qweight: torch.Tensor,
+    scale: torch.Tensor,
+    dtype: torch.dtype,
+) -> torch.Tensor:
+    # NOTE: torch._scaled_mm requires float8 activations as well. Since this
+    # is a weight-only scheme, the weight is dequantized into the activation
+    # dtype and the GEMM runs on the fp16/bf16 tensor cores. This
+    # materializes a full [out, in] temporary per call: only the weight
+    # *storage* is halved, not the per-step bandwidth, which would need the
+    # dequantization fused into the GEMM kernel. See FP8Config.
+    return qweight.to(dtype) * scale.unsqueeze(1)
+
+
+class FP8ColumnParallelLinear(ColumnParallelLinear):
+
+    def create_weights(self, dtype: torch.dtype) -> None:
+        self.weight = Parameter(
+            torch.empty(
+                self.output_size_per_partition,
+                self.input_size,
+                device="cuda",
+                dtype=torch.float8_e4m3fn,
+            ),
+            requires_grad=False,
+        )
+        self.weight_scale = Parameter(
+            torch.empty(
+                self.output_size_per_partition,
+                device="cuda",
+                dtype=dtype,
+            ),
+            requires_grad=False,
+        )
+
+    def apply_weights(
+        self,
+        x: torch.Tensor,
+        bias: Optional[torch.Tensor],
+    ) -> torch.Tensor:
+        weight = _dequantize(self.weight, self.weight_scale, x.dtype)
+        return F.linear(x, weight, bias)
+
+
+class FP8RowParallelLinear(RowParallelLinear):
+
+    def create_weights(self, dtype: torch.dtype) -> None:
+        self.weight = Parameter(
+            torch.empty(
+                self.output_size,
+                self.input_size_per_partition,
+                device="cuda",
+                dtype=torch.float8_e4m3fn,
+            ),
+            requires_grad=False,
+        )
+        # NOTE: The scales are computed from the full weight before it is
+        # sharded along the input dimension, so they are replicated across
+        # the tensor-parallel ranks.
+        self.weight_scale = Parameter(
+            torch.empty(
+                self.output_size,
+                device="cuda",
+                dtype=dtype,
+            ),
+            requires_grad=False,
+        )
+
+    def apply_weights(self, x: torch.Tensor) -> torch.Tensor:
+        weight = _dequantize(self.weight, self.weight_scale, x.dtype)
+        return F.linear(x, weight)
@@ -0,0 +1,110 @@
+from typing import Optional, Tuple
+
+import torch
+from torch.nn.parameter import Parameter
+
+from vllm.model_executor.parallel_utils.layers import (ColumnParallelLinear,
+                                                       RowParallelLinear)
+
+
+def _per_token_quantize(x: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Dynamically quantizes activations to int8 with per-token scales.
+
+    Args:
+        x: shape = [num_tokens, hidden_size]
+
+    Returns:
+        x_q: int8 tensor of the same shape as `x`.
+        scale: float32 tensor of shape [num_tokens, 1].
+    """
+    scale = x.abs().amax(dim=-1, keepdim=True).float().clamp_min(1e-8) / 127.0
+    x_q = torch.round(x.float() / scale).clamp_(-128, 127).to(torch.int8)
+    return x_q, scale
+
+
+def _int8_gemm(x_q: torch.Tensor, qweight: torch.Tensor) -> torch.Tensor:
+    """Computes x_q @ qweight with int8 inputs and an int32 accumulator.
+
+    Args:
+        x_q: int8 tensor of shape [num_tokens, input_size].
+        qweight: int8 tensor of shape [input_size, output_size].
+    """
+    num_tokens = x_q.shape[0]
+    # NOTE: torch._int_mm requires torch >= 2.1 (see requirements.txt);
+    # SmoothQuantConfig.from_config checks for it at load time.
+    # cuBLAS requires more than 16 rows for int8 GEMM. Pad small
+    # decoding batches with zero rows to stay on the int8 tensor cores.
+    if num_tokens <= 16:
+        x_q = torch.nn.functional.pad(x_q, (0, 0, 0, 17 - num_tokens))
+    out = torch._int_mm(x_q, qweight)
+    return out[:num_tokens]
+
+
+class SmoothQuantColumnParallelLinear(ColumnParallelLinear):
+
+    def create_weights(self, dtype: torch.dtype) -> None:
+        del dtype  # Unused: int8 weights with float32 per-channel scales.
+        self.qweight = Parameter(
+            torch.empty(
+                self.input_size,
+                self.output_size_per_partition,
+                device="cuda",
+                dtype=torch.int8,
+            ),
+            requires_grad=False,
+        )
+        self.weight_scale = Parameter(
+            torch.empty(
+                self.output_size_per_partition,
+                device="cuda",
+                dtype=torch.float32,
+            ),
+            requires_grad=False,
+        )
+
+    def apply_weights(
+        self,
+        x: torch.Tensor,
+        bias: Optional[torch.Tensor],
+    ) -> torch.Tensor:
+        out_shape = x.shape[:-1] + (self.qweight.shape[-1], )
+        reshaped_x = x.reshape(-1, x.shape[-1])
+        x_q, x_scale = _per_token_quantize(reshaped_x)
+        out = _int8_gemm(x_q, self.qweight)
+        out = (out.float() * x_scale * self.weight_scale).to(x.dtype)
+        if bias is not None:
+            out = out + bias
+        return out.reshape(out_shape)
+
+
+class SmoothQuantRowParallelLinear(RowParallelLinear):
+
+    def create_weights(self, dtype: torch.dtype) -> None:
+        del dtype  # Unused: int8 weights with float32 per-channel scales.
+        self.qweight = Parameter(
+            torch.empty(
+                self.input_size_per_partition,
+                self.output_size,
+                device="cuda",
+                dtype=torch.int8,
+            ),
+            requires_grad=False,
+        )
+        self.weight_scale = Parameter(
+            torch.empty(
+                self.output_size,
+                device="cuda",
+                dtype=torch.float32,
+            ),
+            requires_grad=False,
+        )
+
+    def apply_weights(self, x: torch.Tensor) -> torch.Tensor:
+        out_shape = x.shape[:-1] + (self.qweight.shape[-1], )
+        reshaped_x = x.reshape(-1, x.shape[-1])
+        x_q, x_scale = _per_token_quantize(reshaped_x)
+        out = _int8_gemm(x_q, self.qweight)
+        # NOTE: The partial sums must be dequantized before the all-reduce
+        # in the parent class, so the output here is in the input dtype.
+        out = (out.float() * x_scale * self.weight_scale).to(x.dtype)
+        return out.reshape(out_shape)
@@ -39,10 +39,18 @@ _MODEL_REGISTRY = {
 
 # FIXME(woosuk): Remove this once all models support quantization.
 _MODEL_CLASSES_SUPPORT_QUANTIZATION = [
+    BaiChuan2ForCausalLM,
+    Baichuan2ForCausalLM,
     LlamaForCausalLM,
     MistralForCausalLM,
 ]
 
+# FIXME: Remove this once all models support KV cache quantization.
+_MODEL_CLASSES_SUPPORT_KV_CACHE_QUANTIZATION = [
+    BaiChuan2ForCausalLM,
+    Baichuan2ForCausalLM,
+]
+
 
 @contextlib.contextmanager
 def _set_default_torch_dtype(dtype: torch.dtype):
@@ -98,13 +106,20 @@ def get_model(model_config: ModelConfig) -> nn.Module:
                 f"method {model_config.quantization}. Supported dtypes: "
                 f"{supported_dtypes}")
 
+    kwargs = {}
+    if model_class in _MODEL_CLASSES_SUPPORT_KV_CACHE_QUANTIZATION:
+        kwargs["kv_cache_dtype"] = model_config.kv_cache_dtype
+    elif model_config.kv_cache_dtype != "auto":
+        raise ValueError(
+            f"KV cache quantization is not supported for {model_class}.")
+
     with _set_default_torch_dtype(model_config.dtype):
         # Create a model instance.
         # The weights will be initialized as empty tensors.
         if model_class in _MODEL_CLASSES_SUPPORT_QUANTIZATION:
-            model = model_class(model_config.hf_config, quant_config)
+            model = model_class(model_config.hf_config, quant_config, **kwargs)
         else:
-            model = model_class(model_config.hf_config)
+            model = model_class(model_config.hf_config, **kwargs)
         if model_config.load_format == "dummy":
             model = model.cuda()
             # NOTE(woosuk): For accurate performance evaluation, we assign
@@ -22,9 +22,13 @@
 The input of the model is flattened to a 1D tensor of tokens. The model uses
 InputMetadata to extract the original 2D shape of the input.
 """
+import dataclasses
+import functools
 import math
-from typing import List, Optional, Tuple
+import os
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import torch
 from torch import nn
 
@@ -36,6 +40,9 @@ from vllm.model_executor.layers.attention import (
     PagedAttentionWithALiBi,
 )
 from vllm.model_executor.layers.sampler import Sampler
+from vllm.model_executor.layers.quantized_linear import ParallelLinear
+from vllm.model_executor.layers.quantized_linear.fp8 import fp8_quantize
+from vllm.model_executor.quantization_utils import QuantizationConfig
 from vllm.model_executor.weight_utils import (
     convert_pyslice_to_tensor,
     hf_model_weights_iterator,
@@ -49,35 +56,107 @@ from vllm.model_executor.parallel_utils.parallel_state import (
 from vllm.model_executor.parallel_utils.layers import (
     VocabParallelEmbedding,
     ColumnParallelLinear,
-    RowParallelLinear,
 )
 from vllm.sequence import SamplerOutput
 from vllm.transformers_utils.configs.baichuan2 import BaiChuan2Config as BaiChuanConfig
 
 KVCache = Tuple[torch.Tensor, torch.Tensor]
 
+# Capture the decode-only forward pass into CUDA graphs and replay them per
+# token. Experimental: opt-in via the environment until the capture path has
+# seen wider coverage.
+_USE_CUDA_GRAPH = os.getenv("VLLM_USE_CUDA_GRAPH", "0") == "1"
 
+
+@functools.lru_cache(maxsize=None)
 def _get_interleave(n):
 
     def _get_interleave_power_of_2(n):
-        start = 2**(-(2**-(math.log2(n) - 3)))
-        ratio = start
-        return [start * ratio**i for i in range(n)]
+        # Closed form of the original start * ratio**i recurrence, where
+        # start == ratio == 2**(-8 / n).
+        ratio = 2.0**(-8.0 / n)
+        return ratio**np.arange(1, n + 1)
 
     if math.log2(n).is_integer():
-        return _get_interleave_power_of_2(n)
+        return _get_interleave_power_of_2(n).tolist()
     else:
         closest_power_of_2 = 2**math.floor(math.log2(n))
-        return (_get_interleave_power_of_2(closest_power_of_2) +
-                _get_interleave(
-                    2 * closest_power_of_2)[0::2][:n - closest_power_of_2])
+        slopes = _get_interleave_power_of_2(closest_power_of_2)
+        extra = _get_interleave_power_of_2(
+            2 * closest_power_of_2)[0::2][:n - closest_power_of_2]
+        return np.concatenate([slopes, extra]).tolist()
 
 
+@functools.lru_cache(maxsize=None)
 def _get_alibi_slopes(total_num_heads: int) -> torch.Tensor:
+    # NOTE: The returned tensor is cached and shared across all layers.
+    # Callers must not mutate it.
     slopes = torch.Tensor(_get_interleave(total_num_heads))
     return slopes
 
 
+@functools.lru_cache(maxsize=None)
+def _get_rank_alibi_slopes(total_num_heads: int, head_start: int,
+                           head_end: int) -> torch.Tensor:
+    # A view into the shared slope tensor; the same caveat on mutation
+    # applies.
+    return _get_alibi_slopes(total_num_heads)[head_start:head_end]
+
+
+@dataclasses.dataclass(frozen=True)
+class _AttentionGeometry:
+    """Per-rank attention geometry shared by all layers of a model.
+
+    Computed once per (model, rank) instead of in every
+    `BaichuanAttention.__init__`, which adds up for many-layer models.
+    """
+    total_num_heads: int
+    num_heads: int
+    head_dim: int
+    head_start: int
+    head_end: int
+    scaling: float
+
+
+@functools.lru_cache(maxsize=None)
+def _get_attention_geometry(
+    hidden_size: int,
+    total_num_heads: int,
+    tp_world_size: int,
+    tp_rank: int,
+) -> _AttentionGeometry:
+    assert total_num_heads % tp_world_size == 0
+    num_heads = total_num_heads // tp_world_size
+    head_dim = hidden_size // total_num_heads
+    return _AttentionGeometry(
+        total_num_heads=total_num_heads,
+        num_heads=num_heads,
+        head_dim=head_dim,
+        head_start=tp_rank * num_heads,
+        head_end=(tp_rank + 1) * num_heads,
+        scaling=head_dim**-0.5,
+    )
+
+
+def _get_scratch_view(
+    buf: Optional[torch.Tensor],
+    shape: Tuple[int, ...],
+    ref: torch.Tensor,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Returns a view of `buf` with the given shape, growing `buf` if needed.
+
+    The buffer is grown geometrically so that steady-state decoding reuses
+    the same allocation instead of hitting the caching allocator on every
+    step.
+    """
+    numel = math.prod(shape)
+    if (buf is None or buf.numel() < numel or buf.dtype != ref.dtype
+            or buf.device != ref.device):
+        capacity = numel if buf is None else max(numel, 2 * buf.numel())
+        buf = torch.empty(capacity, dtype=ref.dtype, device=ref.device)
+    return buf, buf[:numel].view(shape)
+
+
 class MLP(torch.nn.Module):
 
     def __init__(
@@ -85,29 +164,54 @@ class MLP(torch.nn.Module):
         hidden_size: int,
         intermediate_size: int,
         hidden_act: str,
+        quant_config: Optional[QuantizationConfig] = None,
     ):
         super().__init__()
-        self.gate_up_proj = ColumnParallelLinear(
+        self.gate_up_proj = ParallelLinear.column(
             hidden_size,
             2 * intermediate_size,
             bias=False,
             gather_output=False,
+            quant_config=quant_config,
         )
-        self.down_proj = RowParallelLinear(
+        self.down_proj = ParallelLinear.row(
             intermediate_size,
             hidden_size,
             bias=False,
             input_is_parallel=True,
+            quant_config=quant_config,
         )
         if hidden_act != "silu":
             raise ValueError(f"Unsupported activation: {hidden_act}. "
                              "Only silu is supported for now.")
         self.act_fn = SiluAndMul()
 
+        # Lazily allocated scratch buffers reused across forward passes.
+        # The quantized linear layers do not support preallocated outputs.
+        self._use_scratch = quant_config is None
+        self._gate_up_buf: Optional[torch.Tensor] = None
+        self._act_buf: Optional[torch.Tensor] = None
+        self._down_buf: Optional[torch.Tensor] = None
+
     def forward(self, x):
-        gate_up, _ = self.gate_up_proj(x)
-        x = self.act_fn(gate_up)
-        x, _ = self.down_proj(x)
+        gate_up_out = None
+        if self._use_scratch:
+            gate_up_shape = x.shape[:-1] + (
+                self.gate_up_proj.output_size_per_partition, )
+            self._gate_up_buf, gate_up_out = _get_scratch_view(
+                self._gate_up_buf, gate_up_shape, x)
+        gate_up, _ = self.gate_up_proj(x, out=gate_up_out)
+
+        act_shape = x.shape[:-1] + (gate_up.shape[-1] // 2, )
+        self._act_buf, act_out = _get_scratch_view(self._act_buf, act_shape, x)
+        x = self.act_fn(gate_up, out=act_out)
+
+        down_out = None
+        if self._use_scratch:
+            down_shape = x.shape[:-1] + (self.down_proj.output_size, )
+            self._down_buf, down_out = _get_scratch_view(
+                self._down_buf, down_shape, x)
+        x, _ = self.down_proj(x, out=down_out)
         return x
 
 
@@ -119,47 +223,62 @@ class BaichuanAttention(torch.nn.Module):
         hidden_size: int,
         num_heads: int,
         position_embedding: str,
+        quant_config: Optional[QuantizationConfig] = None,
+        geometry: Optional[_AttentionGeometry] = None,
+        kv_cache_dtype: str = "auto",
     ):
         super().__init__()
         self.hidden_size = hidden_size
-        tensor_model_parallel_world_size = get_tensor_model_parallel_world_size(
-        )
-        self.total_num_heads = num_heads
-        assert self.total_num_heads % tensor_model_parallel_world_size == 0
-        self.num_heads = self.total_num_heads // tensor_model_parallel_world_size
-        self.head_dim = hidden_size // self.total_num_heads
+        if geometry is None:
+            geometry = _get_attention_geometry(
+                hidden_size, num_heads, get_tensor_model_parallel_world_size(),
+                get_tensor_model_parallel_rank())
+        self.total_num_heads = geometry.total_num_heads
+        self.num_heads = geometry.num_heads
+        self.head_dim = geometry.head_dim
+        self.qkv_size = self.num_heads * self.head_dim
         self.postion_embedding = position_embedding
 
         # pylint: disable=invalid-name
-        self.W_pack = ColumnParallelLinear(
+        self.W_pack = ParallelLinear.column(
             hidden_size,
             3 * hidden_size,
             bias=False,
             gather_output=False,
+            quant_config=quant_config,
         )
-        self.o_proj = RowParallelLinear(
+        self.o_proj = ParallelLinear.row(
             self.total_num_heads * self.head_dim,
             hidden_size,
             bias=False,
             input_is_parallel=True,
+            quant_config=quant_config,
         )
         # Create the alibi slopes and slice them.
+        # The attention layer owns the per-head KV cache scales when the
+        # cache is quantized to int8.
         if self.postion_embedding == "ALIBI":
-            tp_rank = get_tensor_model_parallel_rank()
-            head_start = tp_rank * self.num_heads
-            head_end = (tp_rank + 1) * self.num_heads
-            alibi_slopes = _get_alibi_slopes(self.total_num_heads)
-            alibi_slopes = alibi_slopes[head_start:head_end].tolist()
-
-            scaling = self.head_dim**-0.5
-            self.attn = PagedAttentionWithALiBi(self.num_heads, self.head_dim,
-                                                scaling, alibi_slopes)
+            alibi_slopes = _get_rank_alibi_slopes(geometry.total_num_heads,
+                                                  geometry.head_start,
+                                                  geometry.head_end)
+            self.attn = PagedAttentionWithALiBi(self.num_heads,
+                                                self.head_dim,
+                                                geometry.scaling,
+                                                alibi_slopes,
+                                                kv_cache_dtype=kv_cache_dtype)
         else:
-            self.scaling = self.head_dim**-0.5
+            self.scaling = geometry.scaling
             self.attn = PagedAttentionWithRoPE(self.num_heads,
                                                self.head_dim,
                                                self.scaling,
-                                               rotary_dim=self.head_dim)
+                                               rotary_dim=self.head_dim,
+                                               kv_cache_dtype=kv_cache_dtype)
+
+        # Lazily allocated scratch buffers reused across forward passes.
+        # The quantized linear layers do not support preallocated outputs.
+        self._use_scratch = quant_config is None
+        self._qkv_buf: Optional[torch.Tensor] = None
+        self._o_proj_buf: Optional[torch.Tensor] = None
 
     def forward(
         self,
@@ -169,34 +288,61 @@ class BaichuanAttention(torch.nn.Module):
         input_metadata: InputMetadata,
         cache_event: Optional[torch.cuda.Event],
     ) -> torch.Tensor:
-        qkv, _ = self.W_pack(hidden_states)
-        q, k, v = qkv.chunk(chunks=3, dim=-1)
+        qkv_out = None
+        if self._use_scratch:
+            qkv_shape = hidden_states.shape[:-1] + (3 * self.qkv_size, )
+            self._qkv_buf, qkv_out = _get_scratch_view(
+                self._qkv_buf, qkv_shape, hidden_states)
+        qkv, _ = self.W_pack(hidden_states, out=qkv_out)
         k_cache, v_cache = kv_cache
         if self.postion_embedding == "ALIBI":
+            # `load_weights` lays out the W_pack output as contiguous
+            # [Q|K|V] component blocks, so these splits are zero-copy views.
+            q, k, v = qkv.split([self.qkv_size] * 3, dim=-1)
             attn_output = self.attn(q, k, v, k_cache, v_cache, input_metadata,
                                     cache_event)
         else:
-            attn_output = self.attn(positions, q, k, v, k_cache, v_cache,
-                                    input_metadata, cache_event)
-
-        output, _ = self.o_proj(attn_output)
+            # The packed qkv tensor is split inside the attention op and
+            # rotary embedding is applied in place, avoiding extra passes
+            # over the query and key.
+            attn_output = self.attn.forward_packed_qkv(positions, qkv, k_cache,
+                                                       v_cache, input_metadata,
+                                                       cache_event)
+
+        o_proj_out = None
+        if self._use_scratch:
+            out_shape = attn_output.shape[:-1] + (self.hidden_size, )
+            self._o_proj_buf, o_proj_out = _get_scratch_view(
+                self._o_proj_buf, out_shape, attn_output)
+        output, _ = self.o_proj(attn_output, out=o_proj_out)
         return output
 
 
 class BaichuanLayer(torch.nn.Module):
 
-    def __init__(self, config: BaiChuanConfig, position_embedding: str):
+    def __init__(
+        self,
+        config: BaiChuanConfig,
+        position_embedding: str,
+        quant_config: Optional[QuantizationConfig] = None,
+        geometry: Optional[_AttentionGeometry] = None,
+        kv_cache_dtype: str = "auto",
+    ):
         super().__init__()
         self.hidden_size = config.hidden_size
         self.self_attn = BaichuanAttention(
             hidden_size=self.hidden_size,
             num_heads=config.num_attention_heads,
             position_embedding=position_embedding,
+            quant_config=quant_config,
+            geometry=geometry,
+            kv_cache_dtype=kv_cache_dtype,
         )
         self.mlp = MLP(
             hidden_size=self.hidden_size,
             intermediate_size=config.intermediate_size,
             hidden_act=config.hidden_act,
+            quant_config=quant_config,
         )
         self.input_layernorm = RMSNorm(config.hidden_size,
                                        eps=config.rms_norm_eps)
@@ -210,11 +356,17 @@ class BaichuanLayer(torch.nn.Module):
         kv_cache: KVCache,
         input_metadata: InputMetadata,
         cache_event: Optional[torch.cuda.Event],
-    ) -> torch.Tensor:
-        # Self Attention
-        residual = hidden_states
-        hidden_states = self.input_layernorm(hidden_states)
+        residual: Optional[torch.Tensor],
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
         # Self Attention
+        if residual is None:
+            residual = hidden_states
+            hidden_states = self.input_layernorm(hidden_states)
+        else:
+            # The previous layer's residual addition is fused into this
+            # layer's input normalization kernel.
+            hidden_states, residual = self.input_layernorm(
+                hidden_states, residual)
         hidden_states = self.self_attn(
             positions=positions,
             hidden_states=hidden_states,
@@ -222,19 +374,23 @@ class BaichuanLayer(torch.nn.Module):
             input_metadata=input_metadata,
             cache_event=cache_event,
         )
-        hidden_states = residual + hidden_states
 
         # Fully Connected
-        residual = hidden_states
-        hidden_states = self.post_attention_layernorm(hidden_states)
+        hidden_states, residual = self.post_attention_layernorm(
+            hidden_states, residual)
         hidden_states = self.mlp(hidden_states)
-        hidden_states = residual + hidden_states
-        return hidden_states
+        return hidden_states, residual
 
 
 class BaichuanModel(nn.Module):
 
-    def __init__(self, config: BaiChuanConfig, position_embedding: str):
+    def __init__(
+        self,
+        config: BaiChuanConfig,
+        position_embedding: str,
+        quant_config: Optional[QuantizationConfig] = None,
+        kv_cache_dtype: str = "auto",
+    ):
         super().__init__()
         self.config = config
         self.padding_idx = config.pad_token_id
@@ -242,11 +398,20 @@ class BaichuanModel(nn.Module):
         self.embed_tokens = VocabParallelEmbedding(
             config.vocab_size,
             config.hidden_size,)
+        # Shared per-rank geometry so the per-layer scalar math is done once.
+        geometry = _get_attention_geometry(
+            config.hidden_size, config.num_attention_heads,
+            get_tensor_model_parallel_world_size(),
+            get_tensor_model_parallel_rank())
         self.layers = nn.ModuleList([
-            BaichuanLayer(config, position_embedding)
+            BaichuanLayer(config, position_embedding, quant_config, geometry,
+                          kv_cache_dtype)
             for _ in range(config.num_hidden_layers)
         ])
         self.norm = RMSNorm(config.hidden_size, eps=config.rms_norm_eps)
+        # Cached sentinel for the no-cache-events case so the forward pass
+        # does not build a [None] * num_layers list per call.
+        self._no_cache_events = [None] * config.num_hidden_layers
 
     def forward(
         self,
@@ -257,29 +422,155 @@ class BaichuanModel(nn.Module):
         cache_events: Optional[List[torch.cuda.Event]],
     ) -> torch.Tensor:
         hidden_states = self.embed_tokens(input_ids)
-        for i in range(len(self.layers)):
-            if cache_events is None:
-                cache_event = None
-            else:
-                cache_event = cache_events[i]
-            layer = self.layers[i]
-            hidden_states = layer(
+        if cache_events is None:
+            cache_events = self._no_cache_events
+        # The residual stream is threaded through the layers and only folded
+        # back into the hidden states inside the fused add+norm kernels, so
+        # no standalone addition is ever materialized.
+        residual = None
+        for layer, kv_cache, cache_event in zip(self.layers, kv_caches,
+                                                cache_events):
+            hidden_states, residual = layer(
                 positions,
                 hidden_states,
-                kv_caches[i],
+                kv_cache,
                 input_metadata,
                 cache_event,
+                residual,
             )
-        hidden_states = self.norm(hidden_states)
+        hidden_states, _ = self.norm(hidden_states, residual)
         return hidden_states
 
 
+def _next_power_of_2(n: int) -> int:
+    return 1 << max(n - 1, 0).bit_length()
+
+
+class _DecodeGraphRunner:
+    """Captures the decode-only forward of BaichuanModel into a CUDA graph.
+
+    Decode steps have static shapes for a given batch size and identical
+    Python control flow, so the per-layer launch sequence can be captured
+    once and replayed per token, eliminating the Python glue and kernel
+    launch overhead of the eager path. Prefill always runs eagerly.
+
+    The runner is sized for a maximum context length and block-table width
+    (rounded up to powers of two); the caller recaptures when a batch
+    outgrows either capacity.
+    """
+
+    _NUM_WARMUP_ITERS = 3
+
+    def __init__(
+        self,
+        model: "BaichuanModel",
+        kv_caches: List[KVCache],
+        batch_size: int,
+        max_context_len: int,
+        max_num_blocks_per_seq: int,
+        max_model_len: int,
+    ) -> None:
+        self.batch_size = batch_size
+        # Cap the rounded capacity at the model's maximum context length:
+        # the worker only validates the paged attention shared-memory usage
+        # up to max_model_len, and rounding past it could capture a kernel
+        # launch the eager path never runs.
+        self.max_context_len = min(_next_power_of_2(max_context_len),
+                                   max(max_model_len, max_context_len))
+        self.max_num_blocks_per_seq = _next_power_of_2(max_num_blocks_per_seq)
+
+        self.input_ids = torch.zeros(batch_size,
+                                     1,
+                                     dtype=torch.long,
+                                     device="cuda")
+        self.positions = torch.zeros(batch_size,
+                                     1,
+                                     dtype=torch.long,
+                                     device="cuda")
+        # NOTE: Slot -1 makes reshape_and_cache skip the write, so warmup
+        # and capture do not corrupt the live KV cache.
+        slot_mapping = torch.full((batch_size, 1),
+                                  -1,
+                                  dtype=torch.long,
+                                  device="cuda")
+        context_lens = torch.ones(batch_size, dtype=torch.int, device="cuda")
+        block_tables = torch.zeros(batch_size,
+                                   self.max_num_blocks_per_seq,
+                                   dtype=torch.int,
+                                   device="cuda")
+        self.input_metadata = InputMetadata(
+            seq_groups=[],
+            seq_data={},
+            prompt_lens=[],
+            slot_mapping=slot_mapping,
+            context_lens=context_lens,
+            max_context_len=self.max_context_len,
+            block_tables=block_tables,
+            selected_token_indices=torch.empty(0,
+                                               dtype=torch.long,
+                                               device="cuda"),
+            categorized_sample_indices={},
+        )
+
+        # Warm up before capture so lazily allocated state (e.g. the
+        # projection scratch buffers) reaches its final size.
+        warmup_stream = torch.cuda.Stream()
+        warmup_stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(warmup_stream):
+            for _ in range(self._NUM_WARMUP_ITERS):
+                model(self.input_ids, self.positions, kv_caches,
+                      self.input_metadata, None)
+        torch.cuda.current_stream().wait_stream(warmup_stream)
+
+        self.graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(self.graph):
+            self.output = model(self.input_ids, self.positions, kv_caches,
+                                self.input_metadata, None)
+
+    def can_run(self, input_metadata: InputMetadata) -> bool:
+        return (input_metadata.max_context_len <= self.max_context_len
+                and input_metadata.max_num_blocks_per_seq
+                <= self.max_num_blocks_per_seq)
+
+    def run(
+        self,
+        input_ids: torch.Tensor,
+        positions: torch.Tensor,
+        input_metadata: InputMetadata,
+    ) -> torch.Tensor:
+        self.input_ids.copy_(input_ids)
+        self.positions.copy_(positions)
+        self.input_metadata.slot_mapping.copy_(input_metadata.slot_mapping)
+        self.input_metadata.context_lens.copy_(input_metadata.context_lens)
+        # Entries beyond each sequence's context length are never read, so
+        # the static block table only needs the live prefix updated.
+        num_blocks = input_metadata.block_tables.shape[1]
+        self.input_metadata.block_tables[:, :num_blocks].copy_(
+            input_metadata.block_tables)
+        self.graph.replay()
+        return self.output
+
+
 class BaiChuanBaseForCausalLM(nn.Module):
 
-    def __init__(self, config, position_embedding: str):
+    def __init__(
+        self,
+        config,
+        position_embedding: str,
+        quant_config: Optional[QuantizationConfig] = None,
+        kv_cache_dtype: str = "auto",
+    ):
         super().__init__()
+        if (quant_config is not None
+                and quant_config.get_name() not in ("fp8", "smoothquant")):
+            raise ValueError(f"{quant_config.get_name()} quantization is not "
+                             "supported for BaiChuan models for now.")
         self.config = config
-        self.model = BaichuanModel(config, position_embedding)
+        self.quant_config = quant_config
+        self.model = BaichuanModel(config, position_embedding, quant_config,
+                                   kv_cache_dtype)
+        # NOTE: The LM head is not quantized since its weight is normalized
+        # at load time.
         self.lm_head = ColumnParallelLinear(
             config.hidden_size,
             config.vocab_size,
@@ -288,6 +579,17 @@ class BaiChuanBaseForCausalLM(nn.Module):
         )
         self.sampler = Sampler(config.vocab_size)
 
+        # CUDA graphs cannot capture the NCCL collectives used with tensor
+        # parallelism, so the graph path is single-GPU only.
+        self._use_cuda_graph = (_USE_CUDA_GRAPH
+                                and get_tensor_model_parallel_world_size()
+                                == 1)
+        self._max_model_len = getattr(config, "model_max_length", None)
+        if self._max_model_len is None:
+            self._max_model_len = getattr(config, "max_position_embeddings",
+                                          2048)
+        self._decode_graphs: Dict[int, _DecodeGraphRunner] = {}
+
     def forward(
         self,
         input_ids: torch.Tensor,
@@ -296,100 +598,252 @@ class BaiChuanBaseForCausalLM(nn.Module):
         input_metadata: InputMetadata,
         cache_events: Optional[List[torch.cuda.Event]],
     ) -> SamplerOutput:
-        hidden_states = self.model(input_ids, positions, kv_caches,
-                                   input_metadata, cache_events)
+        if (self._use_cuda_graph and cache_events is None
+                and input_metadata.num_prompt_tokens == 0
+                and input_metadata.num_generation_tokens > 0):
+            batch_size = input_ids.shape[0]
+            runner = self._decode_graphs.get(batch_size)
+            if runner is None or not runner.can_run(input_metadata):
+                runner = _DecodeGraphRunner(
+                    self.model, kv_caches, batch_size,
+                    input_metadata.max_context_len,
+                    input_metadata.max_num_blocks_per_seq,
+                    self._max_model_len)
+                self._decode_graphs[batch_size] = runner
+            hidden_states = runner.run(input_ids, positions, input_metadata)
+        else:
+            hidden_states = self.model(input_ids, positions, kv_caches,
+                                       input_metadata, cache_events)
         next_tokens = self.sampler(self.lm_head.weight, hidden_states,
                                    input_metadata)
         return next_tokens
 
-    _column_parallel_weights = []
-    _row_parallel_weights = ["o_proj.weight", "down_proj.weight"]
+    _column_parallel_layers = []
+    _row_parallel_layers = ["o_proj", "down_proj"]
 
     def load_weights(self,
                      model_name_or_path: str,
                      cache_dir: Optional[str] = None,
                      load_format: str = "auto",
                      revision: Optional[str] = None):
+        if self.quant_config is None:
+            col_weight_suffixes = ["weight"]
+            row_weight_suffixes = ["weight"]
+        else:
+            col_weight_suffixes = (
+                self.quant_config.get_col_parallel_tensor_names())
+            row_weight_suffixes = (
+                self.quant_config.get_row_parallel_tensor_names())
+
+        column_parallel_weights: List[str] = []
+        for layer in self._column_parallel_layers:
+            for suffix in col_weight_suffixes:
+                column_parallel_weights.append(f"{layer}.{suffix}")
+        row_parallel_weights: List[str] = []
+        for layer in self._row_parallel_layers:
+            for suffix in row_weight_suffixes:
+                row_parallel_weights.append(f"{layer}.{suffix}")
+
         tp_world_size = get_tensor_model_parallel_world_size()
         tp_rank = get_tensor_model_parallel_rank()
         state_dict = self.state_dict()
         has_norm_head = False
 
+        # Precompute the W_pack head geometry and the HF -> vLLM name mapping
+        # for the fused gate_up_proj so the hot loop below does a single dict
+        # lookup per checkpoint entry instead of scanning substrings.
+        total_num_heads = self.config.num_attention_heads
+        hidden_size = self.config.hidden_size
+        head_size = hidden_size // total_num_heads
+        num_heads = total_num_heads // tp_world_size
+        head_start = tp_rank * num_heads
+        head_end = (tp_rank + 1) * num_heads
+
+        # HF weight name -> (vllm name, param, scale_param, stride_id)
+        gate_up_specs = {}
+        for vllm_name, param in state_dict.items():
+            if "gate_up_proj" not in vllm_name:
+                continue
+            scale_param = state_dict.get(f"{vllm_name}_scale")
+            for stride_id, weight_name in enumerate(["gate_proj", "up_proj"]):
+                hf_name = vllm_name.replace("gate_up_proj", weight_name)
+                gate_up_specs[hf_name] = (vllm_name, param, scale_param,
+                                          stride_id)
+        # Gate/up halves accumulated until both are seen, keyed by the fused
+        # param name, so each gate_up_proj param is written with one cat
+        # instead of two strided slice updates.
+        pending_gate_up: Dict[str, Dict[int, Tuple[torch.Tensor,
+                                                   Optional[torch.Tensor]]]]
+        pending_gate_up = {}
+
+        # Layers quantized at load time under fp8: the fp16 checkpoint weight
+        # is converted to float8 with per-output-channel scales on the GPU
+        # before any tensor-parallel slicing, so the scales are consistent
+        # across ranks.
+        is_fp8 = (self.quant_config is not None
+                  and self.quant_config.get_name() == "fp8")
+        fp8_layers = ("W_pack", "o_proj", "gate_proj", "up_proj", "down_proj")
+
+        # Stage host-to-device transfers on a dedicated stream from pinned
+        # source buffers so reading the next checkpoint tensor from disk
+        # overlaps the copy of the previous one. References to in-flight
+        # pinned tensors are held until the stream is drained, which also
+        # bounds the pinned-memory footprint.
+        load_stream = torch.cuda.Stream()
+        in_flight: List[torch.Tensor] = []
+        max_in_flight = 16
+
         for name, loaded_weight in hf_model_weights_iterator(
                 model_name_or_path, cache_dir, load_format, revision):
-            if "rotary_emb.inv_freq" in name:
+            if name.endswith("rotary_emb.inv_freq"):
                 continue
 
             loaded_weight = convert_pyslice_to_tensor(loaded_weight)
-
-            if "W_pack" in name:
-                total_num_heads = self.config.num_attention_heads
-                hidden_size = self.config.hidden_size
-                head_size = hidden_size // total_num_heads
-                num_heads = total_num_heads // tp_world_size
-                head_start = tp_rank * num_heads
-                head_end = (tp_rank + 1) * num_heads
-
-                loaded_weight = loaded_weight.view(3, total_num_heads,
-                                                   head_size, hidden_size)
-                loaded_weight = loaded_weight[:, head_start:head_end, :, :]
-                loaded_weight = loaded_weight.reshape(-1, hidden_size)
-
-            is_gate_up_weight = False
-            for stride_id, weight_name in enumerate(["gate_proj", "up_proj"]):
-                if weight_name not in name:
-                    continue
-                param = state_dict[name.replace(weight_name, "gate_up_proj")]
-                shard_size = param.shape[0] // 2
-                loaded_weight = loaded_weight[shard_size * tp_rank:shard_size *
+            if loaded_weight.device.type == "cpu":
+                if len(in_flight) >= max_in_flight:
+                    load_stream.synchronize()
+                    in_flight.clear()
+                loaded_weight = loaded_weight.pin_memory()
+                in_flight.append(loaded_weight)
+
+            with torch.cuda.stream(load_stream):
+                fp8_scale = None
+                if (is_fp8 and name.endswith(".weight")
+                        and any(layer in name.split(".")
+                                for layer in fp8_layers)):
+                    loaded_weight = loaded_weight.to(
+                        device=torch.cuda.current_device(), non_blocking=True)
+                    loaded_weight, fp8_scale = fp8_quantize(loaded_weight)
+
+                is_transposed = False
+                if self.quant_config is not None:
+                    is_transposed = self.quant_config.is_transposed(name)
+                if is_transposed:
+                    loaded_weight = loaded_weight.T
+
+                if "W_pack" in name.split("."):
+                    # NOTE: The leading axis of the view is the Q/K/V
+                    # component, so the flattened weight stores this rank's Q,
+                    # K, and V rows as contiguous blocks. The attention
+                    # forward relies on this layout to split the packed qkv
+                    # output without copies.
+                    if loaded_weight.dim() == 1:
+                        # Per-channel quantization scales.
+                        loaded_weight = loaded_weight.reshape(
+                            3, total_num_heads, head_size)
+                        loaded_weight = loaded_weight[:,
+                                                      head_start:head_end, :]
+                        loaded_weight = loaded_weight.reshape(-1)
+                    else:
+                        loaded_weight = loaded_weight.reshape(
+                            3, total_num_heads * head_size, hidden_size)
+                        loaded_weight = loaded_weight.narrow(
+                            1, head_start * head_size, num_heads * head_size)
+                        loaded_weight = loaded_weight.reshape(-1, hidden_size)
+                    if fp8_scale is not None:
+                        # Slice the per-output-channel scales the same way as
+                        # the weight rows.
+                        fp8_scale = fp8_scale.reshape(
+                            3, total_num_heads * head_size)
+                        fp8_scale = fp8_scale.narrow(
+                            1, head_start * head_size, num_heads * head_size)
+                        fp8_scale = fp8_scale.reshape(-1)
+
+                gate_up_spec = gate_up_specs.get(name)
+                if gate_up_spec is not None:
+                    key, param, scale_param, stride_id = gate_up_spec
+                    if is_transposed:
+                        param = param.T
+                    shard_size = param.shape[0] // 2
+                    loaded_weight = loaded_weight[shard_size *
+                                                  tp_rank:shard_size *
+                                                  (tp_rank + 1)]
+                    assert loaded_weight.shape[0] == shard_size
+                    if fp8_scale is not None:
+                        fp8_scale = fp8_scale[shard_size *
+                                              tp_rank:shard_size *
                                               (tp_rank + 1)]
-                param_slice = param.data[shard_size * stride_id:shard_size *
-                                         (stride_id + 1)]
-                assert param_slice.shape == loaded_weight.shape
-                param_slice.copy_(loaded_weight)
-                is_gate_up_weight = True
-                break
-            if is_gate_up_weight:
-                continue
+                    halves = pending_gate_up.setdefault(key, {})
+                    halves[stride_id] = (loaded_weight, fp8_scale)
+                    if len(halves) < 2:
+                        continue
+                    del pending_gate_up[key]
+                    (gate, gate_scale), (up, up_scale) = halves[0], halves[1]
+                    # NOTE: Always write the two halves as direct slice
+                    # updates. cat would need same-device operands and has no
+                    # CUDA kernel for the float8 dtypes, while copy_ handles
+                    # every combination the loader produces.
+                    param.data[:shard_size].copy_(gate, non_blocking=True)
+                    param.data[shard_size:].copy_(up, non_blocking=True)
+                    if gate_scale is not None:
+                        scale_slices = scale_param.data.split(shard_size)
+                        scale_slices[0].copy_(gate_scale, non_blocking=True)
+                        scale_slices[1].copy_(up_scale, non_blocking=True)
+                    continue
 
-            param = state_dict[name]
-
-            if name == "lm_head.weight":
-                # print(
-                #     f"loading lm_head weight, norm: {loaded_weight.norm(2.0, 1, True).clamp_min(1e-12)}, shape: {loaded_weight.size()}"
-                # )
-                if loaded_weight.dtype == torch.float16 and loaded_weight.device == torch.device("cpu"):
-                    loaded_weight = torch.nn.functional.normalize(loaded_weight.float()).half()
-                else:
-                    loaded_weight = torch.nn.functional.normalize(loaded_weight)
-                # print(
-                #     f"after normalization, norm: {loaded_weight.norm(2.0, 1, True).clamp_min(1e-12)}, shape: {loaded_weight.size()}"
-                # )
-                has_norm_head = True
-
-            if "embed_tokens" in name or "lm_head" in name:
-                load_padded_tensor_parallel_vocab(param, loaded_weight,
-                                                  tp_rank)
-                continue
+                param = state_dict[name]
+                if is_transposed:
+                    param = param.T
+
+                if name == "lm_head.weight":
+                    # Normalize on the GPU, in place. F.normalize would
+                    # allocate a fresh [vocab, hidden] tensor -- the largest
+                    # in the model -- so only the [vocab, 1] row norms are
+                    # materialized here, accumulated in float32.
+                    loaded_weight = loaded_weight.to(
+                        device=torch.cuda.current_device(), non_blocking=True)
+                    norms = torch.linalg.vector_norm(loaded_weight,
+                                                     dim=1,
+                                                     keepdim=True,
+                                                     dtype=torch.float32)
+                    norms.clamp_min_(1e-12).reciprocal_()
+                    loaded_weight.mul_(norms)
+                    has_norm_head = True
+
+                if "embed_tokens" in name or "lm_head" in name:
+                    load_padded_tensor_parallel_vocab(param,
+                                                      loaded_weight,
+                                                      tp_rank,
+                                                      non_blocking=True)
+                    continue
 
-            load_tensor_parallel_weights(
-                param,
-                loaded_weight,
-                name,
-                self._column_parallel_weights,
-                self._row_parallel_weights,
-                tp_rank,
-            )
+                load_tensor_parallel_weights(
+                    param,
+                    loaded_weight,
+                    name,
+                    column_parallel_weights,
+                    row_parallel_weights,
+                    tp_rank,
+                    non_blocking=True,
+                )
+                if fp8_scale is not None:
+                    # Sliced above for W_pack; replicated across ranks for
+                    # the row-parallel layers.
+                    state_dict[f"{name}_scale"].copy_(fp8_scale,
+                                                      non_blocking=True)
+
+        # Drain the copy stream before the params are used (or moved by
+        # `.cuda()`) on the default stream.
+        load_stream.synchronize()
+        in_flight.clear()
+        assert not pending_gate_up, (
+            f"unpaired gate/up projections: {sorted(pending_gate_up)}")
         assert has_norm_head, "lm_head silently evades normalization"
 
 
 class Baichuan2ForCausalLM(BaiChuanBaseForCausalLM):  # baichuan 13b
 
-    def __init__(self, config):
-        super().__init__(config, "ALIBI")
+    def __init__(self,
+                 config,
+                 quant_config: Optional[QuantizationConfig] = None,
+                 kv_cache_dtype: str = "auto"):
+        super().__init__(config, "ALIBI", quant_config, kv_cache_dtype)
 
 
 class BaiChuan2ForCausalLM(BaiChuanBaseForCausalLM):  # baichuan 7b
 
-    def __init__(self, config):
-        super().__init__(config, "ROPE")
+    def __init__(self,
+                 config,
+                 quant_config: Optional[QuantizationConfig] = None,
+                 kv_cache_dtype: str = "auto"):
+        super().__init__(config, "ROPE", quant_config, kv_cache_dtype)
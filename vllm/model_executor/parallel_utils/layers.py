@@ -156,14 +156,23 @@ class ColumnParallelLinear(torch.nn.Module):
         self,
         x: torch.Tensor,
         bias: Optional[torch.Tensor],
+        out: Optional[torch.Tensor] = None,
     ) -> torch.Tensor:
-        return F.linear(x, self.weight, bias)
-
-    def forward(self, input_):
+        if out is None:
+            return F.linear(x, self.weight, bias)
+        torch.matmul(x, self.weight.t(), out=out)
+        if bias is not None:
+            out += bias
+        return out
+
+    def forward(self, input_, out: Optional[torch.Tensor] = None):
         """Forward of ColumnParallelLinear
 
         Args:
             input_: Tensor whose last dimension is `input_size`.
+            out: Optional preallocated output tensor. When provided, the
+                 matrix multiply writes into it instead of allocating a
+                 fresh tensor. Only supported when `gather_output` is False.
 
         Returns:
             - output
@@ -173,7 +182,11 @@ class ColumnParallelLinear(torch.nn.Module):
 
         input_parallel = input_
         # Matrix multiply.
-        output_parallel = self.apply_weights(input_parallel, bias)
+        if out is None:
+            output_parallel = self.apply_weights(input_parallel, bias)
+        else:
+            assert not self.gather_output
+            output_parallel = self.apply_weights(input_parallel, bias, out)
         if self.gather_output:
             # All-gather across the partitions.
             output = tensor_model_parallel_all_gather(output_parallel)
@@ -262,16 +275,25 @@ class RowParallelLinear(torch.nn.Module):
                         device=torch.cuda.current_device(),
                         dtype=dtype))
 
-    def apply_weights(self, x: torch.Tensor) -> torch.Tensor:
-        return F.linear(x, self.weight)
+    def apply_weights(
+        self,
+        x: torch.Tensor,
+        out: Optional[torch.Tensor] = None,
+    ) -> torch.Tensor:
+        if out is None:
+            return F.linear(x, self.weight)
+        return torch.matmul(x, self.weight.t(), out=out)
 
-    def forward(self, input_):
+    def forward(self, input_, out: Optional[torch.Tensor] = None):
         """Forward of RowParallelLinear
 
         Args:
             input_: tensor whose last dimension is `input_size`. If
                     `input_is_parallel` is set, then the last dimension
                     is `input_size // tp_size`.
+            out: Optional preallocated output tensor. When provided, the
+                 matrix multiply writes into it instead of allocating a
+                 fresh tensor. The all-reduce, if any, is in place.
 
         Returns:
             - output
@@ -288,7 +310,10 @@ class RowParallelLinear(torch.nn.Module):
             input_parallel = splitted_input[tp_rank].contiguous()
 
         # Matrix multiply.
-        output_parallel = self.apply_weights(input_parallel)
+        if out is None:
+            output_parallel = self.apply_weights(input_parallel)
+        else:
+            output_parallel = self.apply_weights(input_parallel, out)
         if self.reduce_results and self.tp_size > 1:
             output_ = tensor_model_parallel_all_reduce(output_parallel)
         else:
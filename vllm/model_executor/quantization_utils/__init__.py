@@ -2,10 +2,15 @@ from typing import Type
 
 from vllm.model_executor.quantization_utils.awq import AWQConfig
 from vllm.model_executor.quantization_utils.base import QuantizationConfig
+from vllm.model_executor.quantization_utils.fp8 import FP8Config
+from vllm.model_executor.quantization_utils.smoothquant import (
+    SmoothQuantConfig)
 from vllm.model_executor.quantization_utils.squeezellm import SqueezeLLMConfig
 
 _QUANTIZATION_REGISTRY = {
     "awq": AWQConfig,
+    "fp8": FP8Config,
+    "smoothquant": SmoothQuantConfig,
     "squeezellm": SqueezeLLMConfig,
 }
 
@@ -0,0 +1,68 @@
+from typing import Any, Dict, List
+
+import torch
+
+from vllm.model_executor.quantization_utils.base import QuantizationConfig
+
+
+class FP8Config(QuantizationConfig):
+    """Config class for FP8 (E4M3) weight-only quantization.
+
+    The checkpoint stays in fp16/bf16; the weights are quantized to float8
+    with per-output-channel scales when they are loaded. Compute runs in the
+    activation dtype, so no activation quantization is involved.
+
+    NOTE: This trades speed for weight storage only. The forward pass
+    dequantizes the weight into the activation dtype before the GEMM, so
+    each projection pays an extra full-weight write and read per call; the
+    savings are in weight memory, not bandwidth. Fusing the dequantization
+    into the GEMM requires a custom kernel.
+    """
+
+    def __repr__(self) -> str:
+        return "FP8Config()"
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "fp8"
+
+    @classmethod
+    def get_supported_act_dtypes(cls) -> List[torch.dtype]:
+        return [torch.half, torch.bfloat16]
+
+    @classmethod
+    def get_min_capability(cls) -> int:
+        # float8_e4m3fn storage and conversions require Ada or Hopper.
+        return 89
+
+    @classmethod
+    def get_config_filenames(cls) -> List[str]:
+        # The weights are quantized at load time from an unmodified fp16
+        # checkpoint, so there is no quantization config to read.
+        return []
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "FP8Config":
+        del config  # Unused: the method has no tunable parameters.
+        if not hasattr(torch, "float8_e4m3fn"):
+            raise ValueError(
+                "fp8 quantization requires the float8_e4m3fn dtype, which "
+                "was added in torch 2.1. Please upgrade torch.")
+        return cls()
+
+    @classmethod
+    def get_packed_tensors(cls) -> Dict[str, int]:
+        # float8 weights are stored one element per byte, i.e., not packed.
+        return {}
+
+    @classmethod
+    def get_transposed_tensor_names(cls) -> List[str]:
+        return []
+
+    @classmethod
+    def get_col_parallel_tensor_names(cls) -> List[str]:
+        return ["weight", "weight_scale"]
+
+    @classmethod
+    def get_row_parallel_tensor_names(cls) -> List[str]:
+        return ["weight"]
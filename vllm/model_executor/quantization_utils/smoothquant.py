@@ -0,0 +1,81 @@
+from typing import Any, Dict, List
+
+import torch
+
+from vllm.model_executor.quantization_utils.base import QuantizationConfig
+
+
+class SmoothQuantConfig(QuantizationConfig):
+    """Config class for SmoothQuant (W8A8).
+
+    Reference: https://arxiv.org/abs/2211.10438
+    """
+
+    def __init__(
+        self,
+        weight_bits: int,
+        act_bits: int,
+    ) -> None:
+        self.weight_bits = weight_bits
+        self.act_bits = act_bits
+
+        if self.weight_bits != 8:
+            raise ValueError(
+                "Currently, only 8-bit weight quantization is supported for "
+                f"SmoothQuant, but got {self.weight_bits} bits.")
+        if self.act_bits != 8:
+            raise ValueError(
+                "Currently, only 8-bit activation quantization is supported "
+                f"for SmoothQuant, but got {self.act_bits} bits.")
+
+    def __repr__(self) -> str:
+        return (f"SmoothQuantConfig(weight_bits={self.weight_bits}, "
+                f"act_bits={self.act_bits})")
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "smoothquant"
+
+    @classmethod
+    def get_supported_act_dtypes(cls) -> List[torch.dtype]:
+        return [torch.half, torch.bfloat16]
+
+    @classmethod
+    def get_min_capability(cls) -> int:
+        # The INT8 GEMM uses the int8 tensor cores, which require
+        # Turing or newer GPUs.
+        return 75
+
+    @classmethod
+    def get_config_filenames(cls) -> List[str]:
+        return [
+            "quant_config.json",
+            "quantize_config.json",
+        ]
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "SmoothQuantConfig":
+        if not hasattr(torch, "_int_mm"):
+            raise ValueError(
+                "SmoothQuant requires the int8 GEMM (torch._int_mm), which "
+                "was added in torch 2.1. Please upgrade torch.")
+        weight_bits = cls.get_from_keys(config, ["w_bit", "bits"])
+        act_bits = cls.get_from_keys(config, ["a_bit", "act_bits"])
+        return cls(weight_bits, act_bits)
+
+    @classmethod
+    def get_packed_tensors(cls) -> Dict[str, int]:
+        # int8 weights are stored one element per int8, i.e., not packed.
+        return {}
+
+    @classmethod
+    def get_transposed_tensor_names(cls) -> List[str]:
+        return ["qweight"]
+
+    @classmethod
+    def get_col_parallel_tensor_names(cls) -> List[str]:
+        return ["qweight", "weight_scale"]
+
+    @classmethod
+    def get_row_parallel_tensor_names(cls) -> List[str]:
+        return ["qweight"]
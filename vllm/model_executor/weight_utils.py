@@ -86,6 +86,12 @@ def get_quant_config(
     model_name_or_path: str,
     cache_dir: Optional[str] = None,
 ) -> QuantizationConfig:
+    quant_cls = get_quant_class(quantization)
+    if not quant_cls.get_config_filenames():
+        # The method has no checkpoint-side config (e.g. fp8, which
+        # quantizes an unmodified checkpoint at load time).
+        return quant_cls.from_config({})
+
     is_local = os.path.isdir(model_name_or_path)
     if not is_local:
         # Download the config files.
@@ -98,7 +104,6 @@ def get_quant_config(
         hf_folder = model_name_or_path
     config_files = glob.glob(os.path.join(hf_folder, "*.json"))
 
-    quant_cls = get_quant_class(quantization)
     quant_config_files = [
         f for f in config_files if any(
             f.endswith(x) for x in quant_cls.get_config_filenames())
@@ -266,13 +271,15 @@ def load_padded_tensor_parallel_vocab(
     param: torch.Tensor,
     loaded_weight: Any,  # `torch.Tensor` or `PySafeSlice`
     tensor_model_parallel_rank: int,
+    non_blocking: bool = False,
 ) -> None:
     shard_size = param.shape[0]
     start_idx = tensor_model_parallel_rank * shard_size
     end_idx = (tensor_model_parallel_rank + 1) * shard_size
     loaded_weight = loaded_weight[start_idx:end_idx]
     loaded_weight = convert_pyslice_to_tensor(loaded_weight)
-    param[:loaded_weight.shape[0]].copy_(loaded_weight)
+    param[:loaded_weight.shape[0]].copy_(loaded_weight,
+                                         non_blocking=non_blocking)
 
 
 def load_tensor_parallel_weights(
@@ -282,6 +289,7 @@ def load_tensor_parallel_weights(
     column_parallel_weight_names: List[str],
     row_parallel_weight_names: List[str],
     tensor_model_parallel_rank: int,
+    non_blocking: bool = False,
 ) -> None:
     for p in column_parallel_weight_names:
         if p in param_name:
@@ -302,7 +310,7 @@ def load_tensor_parallel_weights(
     assert param.shape == loaded_weight.shape, (
         f"{param_name} shape mismatch between model and checkpoint: "
         f"{param.shape} != {loaded_weight.shape}")
-    param.data.copy_(loaded_weight)
+    param.data.copy_(loaded_weight, non_blocking=non_blocking)
 
 
 def initialize_dummy_weights(